@@ -0,0 +1,159 @@
+"""Shared fixtures for the tests."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import yaml
+
+from zlflodata.get_paths import get_data_dir, get_repository_data
+
+
+def _walk(folder: str | os.PathLike):
+    """
+    Yield a DirEntry for every file below folder.
+
+    Uses an iterative os.scandir walk so file types come from the cached DirEntry
+    instead of an extra stat call per file.
+
+    Parameters
+    ----------
+    folder : str or os.PathLike
+        Folder to walk
+
+    Yields
+    ------
+    os.DirEntry
+        Directory entry of each file found
+
+    Notes
+    -----
+    File types are read with ``follow_symlinks=False``, so on most platforms no
+    stat call is made per entry. As a consequence symlinks are not traversed:
+    symlinked directories are not descended into and symlinks to files are not
+    yielded.
+    """
+    stack = [str(folder)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def _index_row(base: str, entry: os.DirEntry) -> tuple[str, str, str, str]:
+    """Return the public_index row of a file entry below the base folder."""
+    rel = entry.path[len(base) + 1 :]
+    parts = rel.split(os.sep, 2)
+    _, dot, ext = entry.name.rpartition(".")
+    return (
+        parts[0],
+        parts[1] if len(parts) > 1 else "",
+        rel,
+        f".{ext.lower()}" if dot else "",
+    )
+
+
+def _index_dataset(
+    base: str, folder: str
+) -> tuple[list[tuple[str, str, str, str]], set[str]]:
+    """
+    Index a data set folder directly below the base folder.
+
+    Returns the public_index rows of the files below folder and the names of the
+    version folders in it. Version folders that are symlinks to a directory are
+    included and walked as well, so they are checked like regular folders.
+    """
+    rows = []
+    versions = set()
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_dir():
+                versions.add(entry.name)
+                rows.extend(_index_row(base, file) for file in _walk(entry.path))
+            else:
+                rows.append(_index_row(base, entry))
+    return rows, versions
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_repository_cache():
+    """Parse repository.yaml once before the tests run.
+
+    Parse errors are left to be reported by the repository.yaml tests.
+    """
+    with contextlib.suppress(yaml.YAMLError):
+        get_repository_data()
+
+
+@pytest.fixture(scope="session")
+def public_tree() -> tuple[list[tuple[str, str, str, str]], dict[str, set[str]]]:
+    """
+    Walk the public data folder once, listing every file and version folder.
+
+    The data set folders are walked concurrently, as each walk is independent and
+    bound by directory reads rather than by the GIL. Data set and version folders
+    that are symlinks to a directory are followed; symlinks below a version folder
+    are not (see `_walk`).
+
+    Returns
+    -------
+    Tuple[List[Tuple[str, str, str, str]], Dict[str, Set[str]]]
+        The public_index rows and the version folder names per data set folder.
+    """
+    base = os.path.join(get_data_dir(), "public")
+
+    rows = []
+    folders = []
+    with os.scandir(base) as it:
+        for entry in it:
+            if entry.is_dir():
+                folders.append(entry.path)
+            else:
+                rows.append(_index_row(base, entry))
+
+    dataset_versions = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(folders)))) as ex:
+        results = ex.map(lambda folder: _index_dataset(base, folder), folders)
+        for folder, (folder_rows, versions) in zip(folders, results):
+            rows.extend(folder_rows)
+            dataset_versions[os.path.basename(folder)] = versions
+    return rows, dataset_versions
+
+
+@pytest.fixture(scope="session")
+def public_index(public_tree) -> list[tuple[str, str, str, str]]:
+    """
+    Return every file in the public data folder.
+
+    Only files are listed; see `public_versions` for the version folders.
+
+    Returns
+    -------
+    List[Tuple[str, str, str, str]]
+        One (dataset, version, rel_path, ext) row per file. rel_path is relative
+        to the public folder, dataset and version are its first two parts (version
+        is empty for files directly in the public folder) and ext is the lowercase
+        suffix including the leading dot.
+    """
+    return public_tree[0]
+
+
+@pytest.fixture(scope="session")
+def public_versions(public_tree) -> dict[str, set[str]]:
+    """
+    Return the version folders per data set folder in the public data folder.
+
+    Empty folders are included.
+
+    Returns
+    -------
+    Dict[str, Set[str]]
+        Mapping of data set folder name to the names of its version folders
+    """
+    return public_tree[1]
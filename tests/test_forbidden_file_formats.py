@@ -2,62 +2,34 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
 from zlflodata.get_paths import get_latest_data_paths
 
+FORBIDDEN_GEO_EXTENSIONS = {".shp", ".shx", ".dbf", ".prj", ".gpkg"}
+EXCEL_EXTENSIONS = {".xls", ".xlsx", ".xlsm"}
 
-def find_files_by_extension(folder: Path, extensions: set[str]) -> list[Path]:
-    """
-    Find all files with given extensions in a folder, case-insensitive.
 
-    Parameters
-    ----------
-    folder : Path
-        Path object representing the folder to search in
-    extensions : Set[str]
-        Set of file extensions to search for (with or without leading dot)
+@pytest.fixture(scope="session")
+def latest_files(public_index) -> list[tuple[str, str]]:
+    """
+    Return the files of the latest data set versions from the public index.
 
     Returns
     -------
-    List[Path]
-        List of Path objects representing found files
-
-    Examples
-    --------
-    >>> files = find_files_by_extension(Path("./data"), {".csv", "txt"})
-    >>> # Will find files like: example.csv, EXAMPLE.CSV, data.TXT
-    >>> print(files[0])
-    ./data/example.csv
-
-    Notes
-    -----
-    The search is case-insensitive, so it will find both lowercase and uppercase
-    extensions (e.g., both .shp and .SHP).
+    List[Tuple[str, str]]
+        One (rel_path, ext) pair per file in a latest data set version
     """
-    matched_files = []
-    # Convert all extensions to lowercase and ensure they have a leading dot
-    normalized_extensions = {
-        (ext if ext.startswith(".") else f".{ext}").lower() for ext in extensions
-    }
-
-    # Get all files in the folder and its subfolders
-    all_files = Path(folder).glob("**/*")
-
-    # Check each file's extension case-insensitively
-    for file_path in all_files:
-        if file_path.is_file():  # Ensure it's a file, not a directory
-            file_ext = file_path.suffix.lower()  # Get lowercase extension
-            if file_ext in normalized_extensions:
-                matched_files.append(file_path)
-
-    return matched_files
+    latest = {path.parts[-2:] for path in get_latest_data_paths()}
+    return [
+        (rel_path, ext)
+        for dataset, version, rel_path, ext in public_index
+        if (dataset, version) in latest
+    ]
 
 
 @pytest.mark.xfail(strict=False)
-def test_no_shapefile_or_geopackage():
+def test_no_shapefile_or_geopackage(latest_files):
     """
     Test for absence of shapefile and geopackage formats.
 
@@ -78,16 +50,12 @@ def test_no_shapefile_or_geopackage():
     - Works better with version control
     - Single file format instead of multiple files (like shapefiles)
     """
-    forbidden_geo_extensions = {".shp", ".shx", ".dbf", ".prj", ".gpkg"}
-    folders = get_latest_data_paths()
-
-    forbidden_files = []
-    for folder in folders:
-        files = find_files_by_extension(folder, forbidden_geo_extensions)
-        forbidden_files.extend(files)
+    forbidden_files = [
+        rel_path for rel_path, ext in latest_files if ext in FORBIDDEN_GEO_EXTENSIONS
+    ]
 
     if forbidden_files:
-        files_str = "\n".join(str(f).split("public/")[-1] for f in forbidden_files)
+        files_str = "\n".join(forbidden_files)
         pytest.fail(
             f"Found prohibited geographic files:\n{files_str}\n\n"
             "Recommendation: Convert these files to GeoJSON format for better "
@@ -96,7 +64,7 @@ def test_no_shapefile_or_geopackage():
 
 
 @pytest.mark.xfail(strict=False)
-def test_no_excel_files():
+def test_no_excel_files(latest_files):
     """
     Test for absence of Excel file formats.
 
@@ -118,16 +86,12 @@ def test_no_excel_files():
     - Simpler to process programmatically
     - More universal compatibility
     """
-    excel_extensions = {".xls", ".xlsx", ".xlsm"}
-    folders = get_latest_data_paths()
-
-    excel_files = []
-    for folder in folders:
-        files = find_files_by_extension(folder, excel_extensions)
-        excel_files.extend(files)
+    excel_files = [
+        rel_path for rel_path, ext in latest_files if ext in EXCEL_EXTENSIONS
+    ]
 
     if excel_files:
-        files_str = "\n".join(str(f).split("public/")[-1] for f in excel_files)
+        files_str = "\n".join(excel_files)
         pytest.fail(
             f"Found Excel files:\n{files_str}\n\n"
             "Recommendation: Convert these files to CSV format for better "
@@ -1,22 +1,46 @@
 """Test folder structure in the repo public folder matches repository.yaml."""
 
 import os
-from pathlib import Path
 
 import pytest
 
 from zlflodata.get_paths import (
     get_abs_data_path,
-    get_data_dir,
     get_repository_data,
 )
 
 
-def test_repo_folder_structure():
+def test_repo_folder_structure(public_index, public_versions):
     """Test that all folders in muckup data folder are present in repository.yaml."""
     rep = get_repository_data()
     assert rep is not None, "Unable to load repository.yaml is None"
 
+    skip_folders = {
+        ".gitkeep",
+        "README.md",
+        ".DS_Store",
+        "Thumbs.db",
+        "license_by-nc-sa-40.txt",
+    }
+
+    # Collect the data set and version folders, and the versions containing files
+    on_disk = {
+        dataset: versions - skip_folders
+        for dataset, versions in public_versions.items()
+        if dataset not in skip_folders
+    }
+    filled_versions = set()
+    for dataset, version, rel_path, _ in public_index:
+        if dataset in skip_folders:
+            continue
+        if not version:
+            pytest.fail(f"File {dataset} in public is not listed in repository.yaml")
+        versions = on_disk.setdefault(dataset, set())
+        if version not in skip_folders:
+            versions.add(version)
+        if rel_path.count(os.sep) > 1:
+            filled_versions.add((dataset, version))
+
     # Test if all paths listed in repository.yaml are present in the public folder
     for name, dataset in rep.items():
         for version in dataset:
@@ -45,41 +69,27 @@ def test_repo_folder_structure():
                     f" {version['paths']['repo']}"
                 )
 
-            assert os.path.exists(path), f"Path {path} does not exist"
-            assert os.listdir(path), f"Path {path} is empty"
+            assert (name, f"v{version['version_zlflo']}") in filled_versions, (
+                f"Path {path} does not exist or is empty"
+            )
 
     # Test if all folders in the public folder are listed in repository.yaml
-    data_repo_path = Path(get_data_dir()) / "public"
-
-    skip_folders = {
-        ".gitkeep",
-        "README.md",
-        ".DS_Store",
-        "Thumbs.db",
-        "license_by-nc-sa-40.txt",
-    }
-
-    for dataset_name in os.listdir(data_repo_path):
-        if dataset_name in skip_folders:
-            continue
-
+    for dataset_name, disk_versions in on_disk.items():
         if dataset_name not in rep:
             pytest.fail(
                 f"Folder {dataset_name} in public is not listed in repository.yaml"
             )
 
-        sort_versions = sorted(
-            [
-                i
-                for i in os.listdir(data_repo_path / dataset_name)
-                if i not in skip_folders
-            ],
-            reverse=True,
-        )
         rep_version = [f"v{version['version_zlflo']}" for version in rep[dataset_name]]
 
-        if sort_versions != rep_version:
+        if disk_versions != set(rep_version) or len(rep_version) != len(disk_versions):
             pytest.fail(
                 f"Versions of {dataset_name} in public folder do not match versions "
                 "in repository.yaml"
             )
+
+        if rep_version != sorted(rep_version, reverse=True):
+            pytest.fail(
+                f"Versions of {dataset_name} in repository.yaml are not ordered "
+                "from newest to oldest"
+            )
@@ -1,61 +1,47 @@
 """Tests for YAML schema validation and linting.
 
-This module validates both schema compliance using yamale and style rules using
-yamllint.
+This module validates both schema compliance using a JSON Schema compiled with
+fastjsonschema and style rules using yamllint.
 """
 
 from pathlib import Path
 
+import fastjsonschema
 import pytest
-import yamale
 import yaml
 from yamllint import config as lint_config
 from yamllint import linter
 
-from zlflodata.get_paths import get_repository_data, get_repository_path
+from zlflodata.get_paths import Loader, get_repository_path
 
 
-def test_repository_yaml_file_validation():
-    """Test both schema validation and linting rules."""
-    # Read YAML content
-    fp_repository_yaml = get_repository_path()
-    fp_schema_repository_yaml = Path(__file__).parent / "schema_repository.yaml"
+@pytest.fixture(scope="session")
+def repo_schema():
+    """Return the JSON Schema for repository.yaml."""
+    fp_schema = Path(__file__).parent / "schema_repository.yaml"
+    with open(fp_schema, encoding="utf-8") as f:
+        return yaml.safe_load(f)
 
-    try:
-        # try opening using yaml.save_load() to catch yaml.YAMLError
-        get_repository_data()
-    except yaml.YAMLError as exc:
-        pytest.fail(f"Error in repository.yaml: {exc}")
 
-    with open(fp_repository_yaml, encoding="utf-8") as f:
-        yaml_content = f.read()
+@pytest.fixture(scope="session")
+def repo_validator(repo_schema):
+    """Return the compiled JSON Schema validator for repository.yaml."""
+    return fastjsonschema.compile(repo_schema)
 
-    schema = yamale.make_schema(fp_schema_repository_yaml)
-    data = yamale.make_data(content=yaml_content)
-    result = yamale.validate(schema, data, _raise_error=False)[0]
-    if result.errors:
-        error_msg = "\nSchema validation problems found:\n"
-        for error in result.errors:
-            error_msg += error
-        pytest.fail(error_msg)
 
+@pytest.fixture(scope="session")
+def version_validator(repo_schema):
+    """Return the compiled JSON Schema validator for a single data set version."""
+    definitions = repo_schema["definitions"]
+    return fastjsonschema.compile(
+        {**definitions["dataset_version"], "definitions": definitions}
+    )
 
-def test_repository_yaml_file_lint():
-    """Test both schema validation and linting rules."""
-    # Read YAML content
-    fp_repository_yaml = get_repository_path()
 
-    try:
-        # try opening using yaml.save_load() to catch yaml.YAMLError
-        get_repository_data()
-    except yaml.YAMLError as exc:
-        pytest.fail(f"Error in repository.yaml: {exc}")
-
-    with open(fp_repository_yaml, encoding="utf-8") as f:
-        yaml_content = f.read()
-
-    # Lint validation
-    lint_conf = lint_config.YamlLintConfig("""
+@pytest.fixture(scope="session")
+def lint_conf():
+    """Return the yamllint configuration for repository.yaml."""
+    return lint_config.YamlLintConfig("""
         extends: default
         rules:
             document-start: disable
@@ -77,7 +63,54 @@ def test_repository_yaml_file_lint():
                 min-spaces-from-content: 2
     """)
 
-    problems = list(linter.run(yaml_content, lint_conf))
+
+@pytest.fixture(scope="session")
+def yaml_text():
+    """Return the text content of repository.yaml."""
+    return Path(get_repository_path()).read_text(encoding="utf-8")
+
+
+def test_repository_yaml_file_validation(repo_validator, version_validator, yaml_text):
+    """Test schema validation of repository.yaml.
+
+    fastjsonschema stops at the first problem, so each data set version is
+    validated separately. This reports the first problem of every invalid version
+    in one run. The whole file is validated only if all versions are valid, so a
+    problem outside the versions is reported on its own.
+    """
+    try:
+        yaml_data = yaml.load(yaml_text, Loader=Loader)
+    except yaml.YAMLError as exc:
+        pytest.fail(f"Error in repository.yaml: {exc}")
+
+    errors = []
+    data = yaml_data.get("data") if isinstance(yaml_data, dict) else None
+    if isinstance(data, dict):
+        for name, versions in data.items():
+            if not isinstance(versions, list):
+                continue
+            for i, version in enumerate(versions):
+                try:
+                    version_validator(version)
+                except fastjsonschema.JsonSchemaException as exc:
+                    errors.append(f"{name}[{i}]: {exc.message}")
+
+    if not errors:
+        try:
+            repo_validator(yaml_data)
+        except fastjsonschema.JsonSchemaException as exc:
+            errors.append(exc.message)
+
+    if errors:
+        error_msg = "\nSchema validation problems found:\n"
+        for error in errors:
+            error_msg += f"{error}\n"
+        pytest.fail(error_msg)
+
+
+def test_repository_yaml_file_lint(lint_conf, yaml_text):
+    """Test linting rules of repository.yaml."""
+    problems = list(linter.run(yaml_text, lint_conf))
 
     # Format lint problems into readable message if any exist
     if problems:
@@ -6,14 +6,24 @@ import logging
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import yaml
-from yaml.loader import SafeLoader
+
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml.dumper import SafeDumper as _Dumper
+    from yaml.loader import SafeLoader as Loader
 
 logger = logging.getLogger(__name__)
 
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+$")
+_VALID_LOCATIONS = frozenset({"get_from_env", "repo", "local"})
+
 
 def get_abs_data_path(
     name="", version="latest", location="get_from_env", local_parent_folder=""
@@ -68,36 +78,26 @@ def get_abs_data_path(
     if location == "get_from_env":
         local_parent_folder = os.environ.get("ZLFLODATA_LOCATION", "")
 
-    if location not in {
-        "get_from_env",  # "get_from_env" is the default
-        "repo",
-        "local",
-    }:
+    if location not in _VALID_LOCATIONS:
         msg = "Location must be 'get_from_env', 'repo', or 'local'"
         raise ValueError(msg)
     if not (is_valid_semver(version) or version == "latest"):
         msg = "Version must be a valid semantic version number or 'latest'"
         raise ValueError(msg)
 
-    rep = get_repository_data()
-
-    if version == "latest":
-        version_index = 0
-
-    else:
-        versions_ordered = [item["version_zlflo"] for item in rep[name]]
-        if version not in versions_ordered:
-            msg = "Version not found in repository.yaml"
-            raise ValueError(msg)
+    versions = _repo_index()[name]
+    if version not in versions:
+        msg = "Version not found in repository.yaml"
+        raise ValueError(msg)
 
-        version_index = versions_ordered.index(version)
+    entry = versions[version]
 
     if location == "repo" or (location == "get_from_env" and not local_parent_folder):
-        rel_path = rep[name][version_index]["paths"]["repo"]
+        rel_path = entry["paths"]["repo"]
         abs_path = os.path.join(get_data_dir(), rel_path)
 
     elif location == "local" or (location == "get_from_env" and local_parent_folder):
-        rel_path = rep[name][version_index]["paths"]["local"]
+        rel_path = entry["paths"]["local"]
         abs_path = os.path.join(local_parent_folder, rel_path)
 
     logger.info("Data path prompted is: %s", abs_path)
@@ -108,6 +108,7 @@ def get_abs_data_path(
     return Path(abs_path)
 
 
+@lru_cache(maxsize=1)
 def get_data_dir():
     """Return the path to the data directory."""
     return os.path.join(os.path.dirname(__file__), "data")
@@ -128,14 +129,16 @@ def get_latest_data_paths() -> list[Path]:
     >>> print(folders[0])
     ./data/subfolder1/v1.2.3
     """
-    dataset_names = sorted(get_repository_data().keys())
-    dataset_paths = [
-        get_abs_data_path(name, version="latest", location="repo")
-        for name in dataset_names
+    data_dir = Path(get_data_dir())
+    index = _repo_index()
+    return [
+        data_dir / index[name]["latest"]["paths"]["repo"]
+        for name in sorted(index)
+        if "latest" in index[name]
     ]
-    return [Path(path) for path in dataset_paths]
 
 
+@lru_cache(maxsize=1)
 def get_repository_path():
     """Return the path to the repository.yaml file from data/repository.yaml."""
     # from importlib.resources import files
@@ -143,21 +146,39 @@ def get_repository_path():
     return os.path.join(data_dir, "repository.yaml")
 
 
+@lru_cache(maxsize=1)
 def get_repository_data():
-    """Return the data from the repository.yaml file."""
+    """Return the data from the repository.yaml file.
+
+    The parsed data is cached, so the returned dictionary must not be modified.
+    """
     with open(get_repository_path(), encoding="utf-8") as file:
-        return yaml.load(file, Loader=SafeLoader)["data"]
+        return yaml.load(file, Loader=Loader)["data"]
+
+
+@lru_cache(maxsize=1)
+def _repo_index():
+    """Return the repository.yaml entries indexed by data set name and version.
+
+    Each data set maps its version numbers and "latest" to the version entry. A data
+    set without versions has no "latest" entry.
+    """
+    index = {}
+    for name, versions in get_repository_data().items():
+        index[name] = {item["version_zlflo"]: item for item in versions}
+        if versions:
+            index[name]["latest"] = versions[0]
+    return index
 
 
 def is_valid_semver(version):
     """Return True if the version is a valid semantic version number."""
-    pattern = re.compile(r"^\d+\.\d+\.\d+$")
-    return pattern.match(version) is not None
+    return _SEMVER_RE.match(version) is not None
 
 
 def create_new_dataset(name, version="1.0.0", location="repo", makedirs=True, **kwargs):  # noqa: FBT002
     """Create a new data set in the repository.yaml file."""
-    rep = get_repository_data()
+    rep = dict(get_repository_data())
 
     if name in rep:
         msg = "Data set already exists in repository.yaml"
@@ -198,11 +219,24 @@ def create_new_dataset(name, version="1.0.0", location="repo", makedirs=True, **
         datadir = Path(get_data_dir())
         (datadir / "public" / name / f"v{version}").mkdir(parents=True, exist_ok=True)
 
-    # write repository.yaml with added dataset
-    with open(get_repository_path(), "w", encoding="utf-8") as file:
-        rep_yml = {
-            "title": "ZLFLO data repository",
-            "description": "Repository containing the public data for ZLFLO.",
-            "data": rep,
-        }
-        yaml.dump(rep_yml, file, allow_unicode=True, sort_keys=False)
+    # write repository.yaml with added dataset to a temporary file and move it in
+    # place, so an interrupted write does not leave a corrupted repository.yaml
+    rep_yml = {
+        "title": "ZLFLO data repository",
+        "description": "Repository containing the public data for ZLFLO.",
+        "data": rep,
+    }
+    fp_repository = Path(get_repository_path())
+    fp_tmp = fp_repository.with_suffix(".yaml.tmp")
+    try:
+        with open(fp_tmp, "w", encoding="utf-8") as file:
+            yaml.dump(
+                rep_yml, file, Dumper=_Dumper, allow_unicode=True, sort_keys=False
+            )
+    except BaseException:
+        fp_tmp.unlink(missing_ok=True)
+        raise
+    os.replace(fp_tmp, fp_repository)
+
+    get_repository_data.cache_clear()
+    _repo_index.cache_clear()